@@ -1,15 +1,16 @@
 """
 Deploys:
 - GKE cluster and node pool
-- Canary deployment on the cluster
+- Optional autoscaled GPU node pool (accelerators, local SSD, image streaming)
+- Optional GPU smoke-test job on the cluster
 """
 
 # Pulumi-provided packages
 import pulumi
 from pulumi_gcp import container
-from pulumi_kubernetes.apps.v1 import Deployment, DeploymentSpecArgs
-from pulumi_kubernetes.core.v1 import ContainerArgs, EnvVarArgs, PodSpecArgs, PodTemplateSpecArgs
-from pulumi_kubernetes.meta.v1 import LabelSelectorArgs, ObjectMetaArgs
+from pulumi_kubernetes.batch.v1 import Job, JobSpecArgs
+from pulumi_kubernetes.core.v1 import ContainerArgs, PodSpecArgs, PodTemplateSpecArgs, ResourceRequirementsArgs, TolerationArgs
+from pulumi_kubernetes.meta.v1 import ObjectMetaArgs
 import pulumi_kubernetes as k8s
 
 # Pequod Components
@@ -24,6 +25,27 @@ master_version = config.get("masterVersion") or container.get_engine_versions().
 node_machine_type = config.get("nodeMachineType") or "n1-standard-1"
 node_count = config.get("nodeCount") or 3 
 
+# GPU node pool config. Autopilot provisions GPU nodes on demand, so the pool is only created for standard clusters.
+gpu_node_pool = config.get_bool("gpuNodePool") or False
+gpu_accelerator = config.get("gpuAccelerator") or "nvidia-l4"
+gpu_machine_type = config.get("gpuMachineType") or "g2-standard-8"
+gpu_count = config.get_int("gpuCount")
+gpu_count = 1 if gpu_count is None else gpu_count
+# Autoscaling limits apply to the whole pool, not per zone.
+gpu_min_nodes = config.get_int("gpuMinNodes")
+gpu_min_nodes = 0 if gpu_min_nodes is None else gpu_min_nodes
+gpu_max_nodes = config.get_int("gpuMaxNodes")
+gpu_max_nodes = 2 if gpu_max_nodes is None else gpu_max_nodes
+# Zones for the GPU pool. Defaults to the cluster's zones, so set this if the accelerator isn't offered in all of them.
+gpu_node_locations = config.get_object("gpuNodeLocations")
+# Only needed if the provider's default location doesn't find the cluster.
+cluster_location = config.get("clusterLocation")
+gpu_local_ssd_count = config.get_int("gpuLocalSsdCount")
+gpu_local_ssd_count = 1 if gpu_local_ssd_count is None else gpu_local_ssd_count
+image_streaming = config.get_bool("imageStreaming")
+image_streaming = True if image_streaming is None else image_streaming
+gpu_smoke_test = config.get_bool("gpuSmokeTest") or False
+
 base_name = pulumi.get_project()
 
 # Create a GKE cluster using the component resource 
@@ -35,29 +57,85 @@ k8s_cluster = Cluster(base_name[:12], ClusterArgs(
 ))
 k8s_provider = k8s.Provider('k8s-provider', kubeconfig=k8s_cluster.kubeconfig, delete_unreachable=True)
 
-# Create a canary deployment to test that the cluster works.
-canary_labels = { "app": f"canary-{base_name}"}
-canary = Deployment("canary", 
-    spec=DeploymentSpecArgs(
-      selector=LabelSelectorArgs(match_labels=canary_labels),
-      replicas=1,
-      template=PodTemplateSpecArgs(
-        metadata=ObjectMetaArgs(labels=canary_labels),
-        spec=PodSpecArgs(containers=[ContainerArgs(
-          name="nginx", 
-          image="nginx",
-          env=[EnvVarArgs(
-            name="DEPLOYMENT_SECRET",
-            value=config.get_secret("deployment_secret")
-          )]
-        )])
-      )
-    ),
-    opts=pulumi.ResourceOptions(provider=k8s_provider)
-)
+gpu_pool = None
+if gpu_node_pool and not autopilot:
+    # Look up the cluster so the pool is created in the location GKE reports for it.
+    # Without an explicit location this resolves the same provider default the cluster was created with.
+    cluster_info = container.get_cluster_output(name=k8s_cluster.cluster_name, location=cluster_location)
+
+    # Separate autoscaled pool for inference workloads.
+    # GKE labels the nodes with cloud.google.com/gke-accelerator and taints them with nvidia.com/gpu.
+    gpu_pool = container.NodePool(f"{base_name[:12]}-gpu",
+        cluster=k8s_cluster.cluster_name,
+        location=cluster_info.location,
+        node_locations=gpu_node_locations,
+        autoscaling=container.NodePoolAutoscalingArgs(
+            total_min_node_count=gpu_min_nodes,
+            total_max_node_count=gpu_max_nodes,
+        ),
+        node_config=container.NodePoolNodeConfigArgs(
+            machine_type=gpu_machine_type,
+            oauth_scopes=["https://www.googleapis.com/auth/cloud-platform"],
+            guest_accelerators=[container.NodePoolNodeConfigGuestAcceleratorArgs(
+                type=gpu_accelerator,
+                count=gpu_count,
+                gpu_driver_installation_config=container.NodePoolNodeConfigGuestAcceleratorGpuDriverInstallationConfigArgs(
+                    gpu_driver_version="LATEST",
+                ),
+            )],
+            # Local SSD backed ephemeral storage speeds up pulling and unpacking large model images.
+            ephemeral_storage_local_ssd_config=container.NodePoolNodeConfigEphemeralStorageLocalSsdConfigArgs(
+                local_ssd_count=gpu_local_ssd_count,
+            ) if gpu_local_ssd_count else None,
+            # Image streaming lets containers start before large images (e.g. Ollama) are fully pulled.
+            # Only applies to images hosted in Artifact Registry.
+            gcfs_config=container.NodePoolNodeConfigGcfsConfigArgs(enabled=image_streaming),
+        ),
+        management=container.NodePoolManagementArgs(
+            auto_repair=True,
+            auto_upgrade=True,
+        ),
+    )
+
+# Run nvidia-smi on a GPU node to test that the cluster can schedule GPU workloads.
+# Standard clusters only have GPU nodes when the GPU node pool is created.
+if gpu_smoke_test and not (gpu_pool or autopilot):
+    pulumi.log.warn("gpuSmokeTest is set but the cluster has no GPU nodes. Set gpuNodePool to true to run the GPU smoke test.")
+elif gpu_smoke_test:
+    smoke_test_labels = { "app": f"gpu-smoke-test-{base_name}"}
+    smoke_test = Job("gpu-smoke-test",
+        spec=JobSpecArgs(
+            backoff_limit=2,
+            template=PodTemplateSpecArgs(
+                metadata=ObjectMetaArgs(labels=smoke_test_labels),
+                spec=PodSpecArgs(
+                    restart_policy="Never",
+                    node_selector={
+                        "cloud.google.com/gke-accelerator": gpu_accelerator,
+                    },
+                    tolerations=[TolerationArgs(
+                        key="nvidia.com/gpu",
+                        operator="Exists",
+                        effect="NoSchedule",
+                    )],
+                    containers=[ContainerArgs(
+                        name="nvidia-smi",
+                        image="nvidia/cuda:12.2.0-base-ubuntu22.04",
+                        command=["nvidia-smi"],
+                        resources=ResourceRequirementsArgs(
+                            limits={"nvidia.com/gpu": str(gpu_count)},
+                        ),
+                    )],
+                ),
+            ),
+        ),
+        opts=pulumi.ResourceOptions(provider=k8s_provider, depends_on=[gpu_pool] if gpu_pool else None)
+    )
 
 stackmgmt = StackSettings(f"{service_name}-stacksettings", 
                           drift_management=config.get("driftManagement"))
 
 pulumi.export('kubeconfig', k8s_cluster.kubeconfig)
 pulumi.export("cluster_name", k8s_cluster.cluster_name)
+if gpu_pool:
+    pulumi.export("gpu_node_pool", gpu_pool.name)
@@ -0,0 +1,110 @@
+"""
+Startup and first-construct benchmark for the CloudRunService provider plugin.
+
+Usage:
+    python benchmark.py [--runs N] [--max-startup-ms MS] [--max-construct-ms MS] [--max-total-ms MS]
+
+Each run uses a fresh interpreter so module caches don't hide import cost, and drives the
+same code path as `component_provider_host`: the imports in __main__.py, the ComponentProvider
+(schema analysis and generation), then Construct calls for the three services that
+gcp-llm-cloudrun-deploy-py creates, run against Pulumi mocks.
+The total (startup + all constructs) is the per-preview cost of the plugin.
+Exits non-zero if a threshold is given and the median exceeds it.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+COMPONENT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+RUN_SNIPPET = """
+import json, time
+start = time.perf_counter()
+from pulumi.provider.experimental import component_provider_host
+from cloudRunService import CloudRunService
+
+# component_provider_host builds this before serving; it runs the schema analysis.
+from pulumi.provider.experimental.component import ComponentProvider
+provider = ComponentProvider([CloudRunService], "cloudrunservice")
+startup = time.perf_counter()
+
+import pulumi
+
+class Mocks(pulumi.runtime.Mocks):
+    def new_resource(self, args):
+        return [args.name + "_id", args.inputs]
+    def call(self, args):
+        return {}
+
+pulumi.runtime.set_mocks(Mocks(), preview=True)
+
+# Same shapes as the Ollama, agent and Open WebUI services in gcp-llm-cloudrun-deploy-py.
+services = [
+    {"location": "us-central1", "image": "ollama", "cpu": 8, "memory": "16Gi", "numGpus": 1,
+     "servicePort": 11434, "bucketName": "bench-bucket", "mountPath": "/root/.ollama/"},
+    {"location": "us-central1", "image": "agent", "cpu": 2, "memory": "4Gi", "servicePort": 8080,
+     "envs": [{"name": "MODEL_NAME", "value": "gemma3:latest"}]},
+    {"location": "us-central1", "image": "openwebui", "cpu": 8, "memory": "16Gi", "servicePort": 8080,
+     "envs": [{"name": "WEBUI_AUTH", "value": "false"}]},
+]
+construct_times = []
+for i, inputs in enumerate(services):
+    t = time.perf_counter()
+    provider.construct(f"bench-{i}", "cloudrunservice:index:CloudRunService", inputs, pulumi.ResourceOptions())
+    construct_times.append(time.perf_counter() - t)
+end = time.perf_counter()
+
+print(json.dumps({
+    "startup_ms": (startup - start) * 1000,
+    "first_construct_ms": construct_times[0] * 1000,
+    "total_ms": (end - start) * 1000,
+}))
+"""
+
+
+def run_once():
+    result = subprocess.run(
+        [sys.executable, "-c", RUN_SNIPPET],
+        cwd=COMPONENT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh-interpreter runs.")
+    parser.add_argument("--max-startup-ms", type=float, help="Fail if median startup time exceeds this.")
+    parser.add_argument("--max-construct-ms", type=float, help="Fail if median first-construct time exceeds this.")
+    parser.add_argument("--max-total-ms", type=float, help="Fail if median startup plus all constructs exceeds this.")
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(args.runs)]
+    medians = {key: statistics.median(r[key] for r in runs) for key in ("startup_ms", "first_construct_ms", "total_ms")}
+
+    print(f"provider startup + schema (median of {args.runs}): {medians['startup_ms']:.1f} ms")
+    print(f"first construct           (median of {args.runs}): {medians['first_construct_ms']:.1f} ms")
+    print(f"startup + 3 constructs    (median of {args.runs}): {medians['total_ms']:.1f} ms")
+
+    limits = {
+        "startup_ms": args.max_startup_ms,
+        "first_construct_ms": args.max_construct_ms,
+        "total_ms": args.max_total_ms,
+    }
+    failures = [
+        f"{key} {medians[key]:.1f} ms exceeds {limit} ms"
+        for key, limit in limits.items()
+        if limit is not None and medians[key] > limit
+    ]
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,8 @@ class CloudRunServiceArgs (TypedDict):
     """Number of GPUs to allocate for the container. (optional)"""
     service_port: pulumi.Input[int]
     """Port for the service."""
+    timeout: Optional[pulumi.Input[str]]
+    """Maximum request duration, e.g. "3600s". Cloud Run defaults to 300s and allows up to 3600s. (optional)"""
 
 class CloudRunService(pulumi.ComponentResource):
     """
@@ -109,6 +111,10 @@ class CloudRunService(pulumi.ComponentResource):
             },
         }
         
+        # Add request timeout if provided
+        if args.get("timeout"):
+            template_config["timeout"] = args.get("timeout")
+
         # Add node_selector if num_gpus is provided
         if args.get("num_gpus"):
             template_config["node_selector"] = {
@@ -23,6 +23,8 @@ llm_model = config.get("llmModel") or "gemma3:latest"
 llm_cpu = config.get_int("llmCpu") or 8
 llm_memory = config.get("llmMemory") or "16Gi"
 llm_num_gpus = config.get_int("llmNumGpus") or 1
+# Parallel requests Ollama serves; the agent's batch API uses the same value for its concurrency.
+llm_num_parallel = config.get_int("llmNumParallel") or 4
 stack_ttl = config.get_int("stackTtl") 
 drift_management = config.get("driftManagement") 
 
@@ -51,6 +53,12 @@ ollama_cr_service = cloudrunservice.CloudRunService(f"ollama-{base_name}",
     service_port=11434,
     bucket_name=llm_bucket.name,
     mount_path="/root/.ollama/",
+    envs=[
+        {
+            "name":"OLLAMA_NUM_PARALLEL",
+            "value":str(llm_num_parallel),
+        }
+    ],
 )
 
 # Use Command provider to install an model if specified via Ollama API
@@ -68,6 +76,8 @@ agent_cr_service = cloudrunservice.CloudRunService(f"agent-{base_name}",
     cpu=2,
     memory="4Gi",
     service_port=8080,
+    # Streamed /batch responses are cut off at the request timeout, so use the Cloud Run maximum.
+    timeout="3600s",
     envs=[
         {
             "name":"GOOGLE_CLOUD_PROJECT",
@@ -82,6 +92,9 @@ agent_cr_service = cloudrunservice.CloudRunService(f"agent-{base_name}",
         },{
             "name":"OLLAMA_API_BASE",
             "value":ollama_cr_service.uri,
+        },{
+            "name":"BATCH_CONCURRENCY",
+            "value":str(llm_num_parallel),
         }
     ],
     opts=pulumi.ResourceOptions(depends_on=[ollama_cr_service]),
@@ -40,6 +40,12 @@ ollama = ServiceDeployment(
     node_selector={
         "cloud.google.com/gke-accelerator": config.llm_gke_accelerator,
     },
+    env_vars=[
+        {
+            "name": "OLLAMA_NUM_PARALLEL",
+            "value": str(config.llm_num_parallel),
+        },
+    ],
     opts=pulumi.ResourceOptions(provider=k8s_provider),
 )
 
@@ -103,6 +109,10 @@ agent = ServiceDeployment(
             "name": "OLLAMA_API_BASE",
             "value": ollama_uri,
         },
+        {
+            "name": "BATCH_CONCURRENCY",
+            "value": str(config.llm_num_parallel),
+        },
     ],
     opts=pulumi.ResourceOptions(provider=k8s_provider, depends_on=[ollama]),
 )
@@ -14,6 +14,8 @@ llm_model = config.get("llmModel") or "gemma3:latest"
 llm_cpu = config.get_int("llmCpu") or 4 
 llm_mem = config.get("llmMem") or "16Gi"
 llm_gpu_count = config.get("gpuCount") or "1"
+# Parallel requests Ollama serves; the agent's batch API uses the same value for its concurrency.
+llm_num_parallel = config.get_int("llmNumParallel") or 4
 
 # GPU accelerator type for GKE Autopilot. Must be a valid accelerator in the target region.
 # Examples: 'nvidia-l4', 'nvidia-tesla-t4'. A100 may require special quota and might not be available.
@@ -0,0 +1,186 @@
+"""
+Bulk/offline batch inference for the ADK agent.
+
+POST a JSONL body to /batch, one object per line: {"id": "faq-1", "prompt": "..."}.
+Lines without an "id" use their 1-based line number. Results stream back as JSONL
+in input order, followed by a summary line with aggregate throughput.
+To resume an interrupted job, upload the same file with ?resume_after=<last id received>.
+
+Batch items share a global concurrency limit (BATCH_CONCURRENCY, set by the deploy stacks
+to match OLLAMA_NUM_PARALLEL on the Ollama service) and wait while agent runs from
+interactive clients are in flight, so chat traffic is served first.
+"""
+import asyncio
+import json
+import os
+import time
+import uuid
+
+from fastapi import APIRouter, FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from prod.agent import root_agent
+
+# Should match OLLAMA_NUM_PARALLEL on the Ollama service so batch items don't queue up inside the backend.
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY") or 4)
+BATCH_APP_NAME = "batch"
+BATCH_USER_ID = "batch"
+
+# ADK agent-run endpoints used by interactive clients (including the dev UI).
+INTERACTIVE_PATHS = ("/run", "/run_sse")
+
+router = APIRouter()
+
+session_service = InMemorySessionService()
+runner = Runner(agent=root_agent, app_name=BATCH_APP_NAME, session_service=session_service)
+
+batch_slots = asyncio.Semaphore(BATCH_CONCURRENCY)
+interactive_idle = asyncio.Event()
+interactive_idle.set()
+interactive_in_flight = 0
+
+
+class InteractivePriorityMiddleware:
+    """
+    Counts in-flight interactive agent runs. Written as plain ASGI middleware so a streamed
+    (SSE) response is counted until its body has finished sending, not just its headers.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        global interactive_in_flight
+        if scope["type"] != "http" or scope["path"] not in INTERACTIVE_PATHS:
+            return await self.app(scope, receive, send)
+        interactive_in_flight += 1
+        interactive_idle.clear()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            interactive_in_flight -= 1
+            if interactive_in_flight == 0:
+                interactive_idle.set()
+
+
+def track_interactive_requests(app: FastAPI):
+    """Registers middleware that pauses batch items while interactive agent runs are in flight."""
+    app.add_middleware(InteractivePriorityMiddleware)
+
+
+def parse_items(body: bytes):
+    """Parses the uploaded JSONL into a list of (id, prompt) tuples."""
+    try:
+        text = body.decode("utf-8")
+    except UnicodeDecodeError as e:
+        line_number = body.count(b"\n", 0, e.start) + 1
+        raise HTTPException(status_code=400, detail=f"Line {line_number}: invalid UTF-8 ({e.reason})")
+    items = []
+    seen_ids = set()
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise HTTPException(status_code=400, detail=f"Line {line_number}: invalid JSON ({e.msg})")
+        if not isinstance(item, dict) or not isinstance(item.get("prompt"), str):
+            raise HTTPException(status_code=400, detail=f"Line {line_number}: expected an object with a 'prompt' string")
+        item_id = str(item.get("id", line_number))
+        if item_id in seen_ids:
+            raise HTTPException(status_code=400, detail=f"Line {line_number}: duplicate id '{item_id}'")
+        seen_ids.add(item_id)
+        items.append((item_id, item["prompt"]))
+    return items
+
+
+async def run_prompt(prompt: str) -> str:
+    """Runs a single prompt through the agent in its own session and returns the final response text."""
+    session = await session_service.create_session(app_name=BATCH_APP_NAME, user_id=BATCH_USER_ID, session_id=str(uuid.uuid4()))
+    message = types.Content(role="user", parts=[types.Part(text=prompt)])
+    response = ""
+    try:
+        async for event in runner.run_async(user_id=BATCH_USER_ID, session_id=session.id, new_message=message):
+            if event.is_final_response() and event.content and event.content.parts:
+                response = "".join(part.text or "" for part in event.content.parts)
+    finally:
+        await session_service.delete_session(app_name=BATCH_APP_NAME, user_id=BATCH_USER_ID, session_id=session.id)
+    return response
+
+
+async def run_item(item_id: str, prompt: str) -> dict:
+    async with batch_slots:
+        # Yield to interactive traffic before taking up a backend slot.
+        await interactive_idle.wait()
+        start = time.perf_counter()
+        try:
+            response = await run_prompt(prompt)
+        except Exception as e:
+            return {"id": item_id, "status": "error", "error": str(e), "seconds": round(time.perf_counter() - start, 3)}
+        return {"id": item_id, "status": "ok", "response": response, "seconds": round(time.perf_counter() - start, 3)}
+
+
+@router.post("/batch")
+async def batch_inference(request: Request, resume_after: str | None = None):
+    items = parse_items(await request.body())
+
+    skipped = 0
+    if resume_after is not None:
+        ids = [item_id for item_id, _ in items]
+        if resume_after not in ids:
+            raise HTTPException(status_code=400, detail=f"resume_after id '{resume_after}' not found in upload")
+        skipped = ids.index(resume_after) + 1
+        items = items[skipped:]
+
+    async def stream_results():
+        start = time.perf_counter()
+        succeeded = failed = 0
+        # Bounded window of started items, consumed in input order. The producer stays at most
+        # BATCH_CONCURRENCY items ahead, so memory and head-of-line stalls stay bounded.
+        pending = asyncio.Queue(maxsize=BATCH_CONCURRENCY)
+
+        async def produce():
+            for item_id, prompt in items:
+                task = asyncio.create_task(run_item(item_id, prompt))
+                try:
+                    await pending.put(task)
+                except asyncio.CancelledError:
+                    task.cancel()
+                    raise
+            await pending.put(None)
+
+        producer = asyncio.create_task(produce())
+        task = None
+        try:
+            # Emit in input order so resume_after can pick up exactly where the client stopped reading.
+            while (task := await pending.get()) is not None:
+                result = await task
+                if result["status"] == "ok":
+                    succeeded += 1
+                else:
+                    failed += 1
+                yield json.dumps(result) + "\n"
+        finally:
+            # Stop outstanding work if the client disconnects mid-stream.
+            producer.cancel()
+            if task is not None:
+                task.cancel()
+            while not pending.empty():
+                queued = pending.get_nowait()
+                if queued is not None:
+                    queued.cancel()
+        elapsed = time.perf_counter() - start
+        yield json.dumps({"summary": {
+            "total": len(items),
+            "succeeded": succeeded,
+            "failed": failed,
+            "skipped": skipped,
+            "concurrency": BATCH_CONCURRENCY,
+            "elapsed_seconds": round(elapsed, 3),
+            "items_per_second": round(len(items) / elapsed, 3) if elapsed else 0.0,
+        }}) + "\n"
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
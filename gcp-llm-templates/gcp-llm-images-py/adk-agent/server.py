@@ -6,6 +6,8 @@ from google.adk.cli.fast_api import get_fast_api_app
 # Load environment variables
 load_dotenv()
 
+from batch import router as batch_router, track_interactive_requests
+
 AGENT_DIR = os.path.dirname(os.path.abspath(__file__))
 app_args = {"agents_dir": AGENT_DIR, "web": True}
 
@@ -17,6 +19,10 @@ app.title = "Production ADK Agent - Lab 3"
 app.description = "Gemma agent with GPU-accelerated backend"
 app.version = "1.0.0"
 
+# Bulk/offline inference, run at lower priority than interactive traffic
+app.include_router(batch_router)
+track_interactive_requests(app)
+
 @app.get("/health")
 def health_check():
     return {"status": "healthy", "service": "production-adk-agent"}
@@ -27,7 +33,8 @@ def root():
         "service": "Production ADK Agent - Lab 3",
         "description": "GPU-accelerated Gemma agent",
         "docs": "/docs",
-        "health": "/health"
+        "health": "/health",
+        "batch": "/batch"
     }
 
 if __name__ == "__main__":